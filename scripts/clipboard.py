@@ -0,0 +1,153 @@
+"""
+Win32 clipboard access for Whisper Tray.
+Talks to the clipboard directly through ctypes (no pyperclip), so a paste can
+save, replace and restore the clipboard text with one OpenClipboard round-trip each.
+"""
+import contextlib
+import ctypes
+import time
+from ctypes import wintypes
+from typing import Optional
+
+CF_UNICODETEXT = 13
+GMEM_MOVEABLE = 0x0002
+HWND_MESSAGE = -3  # Parent for message-only windows
+
+_user32 = None
+_kernel32 = None
+
+
+def _win32():
+    """Load user32/kernel32 and declare the handle-returning signatures."""
+    global _user32, _kernel32
+    if _user32 is None:
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+        user32.OpenClipboard.argtypes = [wintypes.HWND]
+        user32.OpenClipboard.restype = wintypes.BOOL
+        user32.CloseClipboard.restype = wintypes.BOOL
+        user32.EmptyClipboard.restype = wintypes.BOOL
+        user32.GetClipboardData.argtypes = [wintypes.UINT]
+        user32.GetClipboardData.restype = wintypes.HANDLE
+        user32.SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+        user32.SetClipboardData.restype = wintypes.HANDLE
+        user32.CreateWindowExW.argtypes = [
+            wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+            ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+            wintypes.HWND, wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID,
+        ]
+        user32.CreateWindowExW.restype = wintypes.HWND
+        user32.DestroyWindow.argtypes = [wintypes.HWND]
+        user32.DestroyWindow.restype = wintypes.BOOL
+
+        kernel32.GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+        kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+        kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+        kernel32.GlobalLock.restype = wintypes.LPVOID
+        kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+        kernel32.GlobalUnlock.restype = wintypes.BOOL
+        kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
+        kernel32.GlobalFree.restype = wintypes.HGLOBAL
+
+        _user32, _kernel32 = user32, kernel32
+    return _user32, _kernel32
+
+
+@contextlib.contextmanager
+def _opened(retries: int = 10):
+    """Open the clipboard for the duration of the block.
+
+    SetClipboardData fails after EmptyClipboard if the clipboard was opened
+    without an owner window, so a hidden message-only window owns it for the
+    call. It's destroyed again afterwards rather than kept around: an owner
+    window on a thread that doesn't pump messages would stall other programs
+    that empty the clipboard.
+    """
+    user32, _ = _win32()
+    hwnd = user32.CreateWindowExW(
+        0, "STATIC", None, 0, 0, 0, 0, 0, wintypes.HWND(HWND_MESSAGE), None, None, None
+    )
+    if not hwnd:
+        raise OSError(f"Could not create clipboard window (error {ctypes.get_last_error()})")
+    try:
+        # Retry while another process holds the clipboard
+        for _ in range(retries):
+            if user32.OpenClipboard(hwnd):
+                break
+            time.sleep(0.01)
+        else:
+            raise OSError(f"Could not open the clipboard (error {ctypes.get_last_error()})")
+        try:
+            yield
+        finally:
+            user32.CloseClipboard()
+    finally:
+        user32.DestroyWindow(hwnd)
+
+
+def _get_text() -> Optional[str]:
+    """Read CF_UNICODETEXT from the open clipboard."""
+    user32, kernel32 = _win32()
+    handle = user32.GetClipboardData(CF_UNICODETEXT)
+    if not handle:
+        return None
+    ptr = kernel32.GlobalLock(handle)
+    if not ptr:
+        return None
+    try:
+        return ctypes.wstring_at(ptr)
+    finally:
+        kernel32.GlobalUnlock(handle)
+
+
+def _set_text(text: str):
+    """Replace the contents of the open clipboard with text."""
+    user32, kernel32 = _win32()
+    data = ctypes.create_unicode_buffer(text)
+    size = ctypes.sizeof(data)
+
+    handle = kernel32.GlobalAlloc(GMEM_MOVEABLE, size)
+    if not handle:
+        raise MemoryError("GlobalAlloc failed for clipboard text")
+    ptr = kernel32.GlobalLock(handle)
+    if not ptr:
+        kernel32.GlobalFree(handle)
+        raise MemoryError("GlobalLock failed for clipboard text")
+    ctypes.memmove(ptr, data, size)
+    kernel32.GlobalUnlock(handle)
+
+    user32.EmptyClipboard()
+    if not user32.SetClipboardData(CF_UNICODETEXT, handle):
+        # Ownership only passes to the system on success
+        kernel32.GlobalFree(handle)
+        raise OSError(f"SetClipboardData failed (error {ctypes.get_last_error()})")
+
+
+def copy(text: str):
+    """Put text on the clipboard."""
+    snapshot_and_set(text, snapshot=False)
+
+
+def snapshot_and_set(text: str, snapshot: bool = True) -> Optional[str]:
+    """Put text on the clipboard, returning the text it replaces.
+
+    Args:
+        text: Text to place on the clipboard
+        snapshot: Whether to read the previous text first
+
+    Returns:
+        The previous clipboard text, or None if not requested or not text
+    """
+    with _opened():
+        previous = _get_text() if snapshot else None
+        _set_text(text)
+    return previous
+
+
+def restore(previous: Optional[str]):
+    """Put back text returned by snapshot_and_set()."""
+    if previous is None:
+        return
+    with _opened():
+        _set_text(previous)
@@ -2,6 +2,8 @@
 Configuration management for Whisper Tray.
 Handles loading, saving, and default values for user settings.
 """
+import copy
+import importlib.util
 import json
 import os
 from pathlib import Path
@@ -16,12 +18,22 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     "send_enter": True,
     "keep_clipboard": False,
     "use_typing": False,
+    "batch_typing": False,  # Typing mode: one Unicode SendInput batch instead of real key presses
     "trailing_space": True,
     "show_status_window": False,
     "device": "cpu",
-    "compute_type": "int8",
+    "compute_type": None,  # None = int8 on CPU, int8_float16 on CUDA
+    "cpu_threads": 0,  # 0 = one per physical core
+    "num_workers": 1,  # Parallel transcriptions per model (the app runs one at a time)
     "samplerate": 16000,
     "beam_size": 1,
+    # Dictation decoding options - skip work whose output is never used
+    "without_timestamps": True,  # Don't generate timestamp tokens
+    "condition_on_previous_text": False,  # Each dictation stands alone
+    "vad_filter": True,  # Skip silent stretches before decoding
+    "vad_min_silence_ms": 300,  # Silence length the VAD filter cuts on
+    "min_audio_seconds": 0.4,  # Shorter recordings are dropped without transcribing
+    "min_audio_level": 0.005,  # Recordings peaking below this are treated as silence
     "pre_type_delay": 0.2,
     "type_delay": 0.0,
     "first_run_complete": False,
@@ -37,6 +49,7 @@ DEFAULT_CONFIG: Dict[str, Any] = {
 }
 
 # Model descriptions for UI
+# repo_id is the HuggingFace repo faster-whisper downloads each model from
 MODEL_INFO = {
     "tiny": {
         "size": "~75 MB",
@@ -44,6 +57,7 @@ MODEL_INFO = {
         "accuracy": "Basic",
         "recommended": False,
         "description": "Fastest transcription, basic accuracy. Good for quick notes.",
+        "repo_id": "Systran/faster-whisper-tiny",
     },
     "base": {
         "size": "~145 MB",
@@ -51,6 +65,7 @@ MODEL_INFO = {
         "accuracy": "Good",
         "recommended": False,
         "description": "Fast with good accuracy. Suitable for clear speech.",
+        "repo_id": "Systran/faster-whisper-base",
     },
     "small": {
         "size": "~465 MB",
@@ -58,6 +73,7 @@ MODEL_INFO = {
         "accuracy": "Good",
         "recommended": True,
         "description": "Best balance of speed and accuracy. Recommended for most users.",
+        "repo_id": "Systran/faster-whisper-small",
     },
     "medium": {
         "size": "~1.5 GB",
@@ -65,6 +81,7 @@ MODEL_INFO = {
         "accuracy": "Better",
         "recommended": False,
         "description": "Higher accuracy but slower. Good for complex vocabulary.",
+        "repo_id": "Systran/faster-whisper-medium",
     },
     "large-v2": {
         "size": "~3.0 GB",
@@ -72,6 +89,7 @@ MODEL_INFO = {
         "accuracy": "Excellent",
         "recommended": False,
         "description": "High accuracy. Requires more memory and time.",
+        "repo_id": "Systran/faster-whisper-large-v2",
     },
     "large-v3": {
         "size": "~3.0 GB",
@@ -79,6 +97,7 @@ MODEL_INFO = {
         "accuracy": "Best",
         "recommended": False,
         "description": "Latest and most accurate model. Best for critical transcriptions.",
+        "repo_id": "Systran/faster-whisper-large-v3",
     },
     "turbo": {
         "size": "~1.6 GB",
@@ -86,9 +105,13 @@ MODEL_INFO = {
         "accuracy": "Excellent",
         "recommended": False,
         "description": "Optimized large-v3. 8x faster with near-best accuracy. Great choice!",
+        "repo_id": "mobiuslabsgmbh/faster-whisper-large-v3-turbo",
     },
 }
 
+# CTranslate2 compute types offered in settings (None/"auto" picks per device)
+COMPUTE_TYPES = ["int8", "int8_float16", "float16", "float32"]
+
 # Supported languages
 LANGUAGES = {
     "en": "English",
@@ -175,16 +198,28 @@ def get_config_path() -> Path:
     return get_config_dir() / "config.json"
 
 
+# Last parsed config file, keyed by path, mtime and size so the file is only
+# re-read when it changes (including edits made outside the app). Stored as a
+# single (key, config) entry so threads never see a key without its config.
+_config_cache: Dict[str, Any] = {}
+
+
 def load_config() -> Dict[str, Any]:
     """Load configuration from file, returning defaults for missing keys.
 
     Returns:
         Dictionary with all config values (defaults merged with saved values)
     """
-    config = DEFAULT_CONFIG.copy()
     config_path = get_config_path()
-
-    if config_path.exists():
+    try:
+        stat = config_path.stat()
+    except OSError:
+        return DEFAULT_CONFIG.copy()
+
+    cache_key = (str(config_path), stat.st_mtime_ns, stat.st_size)
+    entry = _config_cache.get("entry")
+    if entry is None or entry[0] != cache_key:
+        config = DEFAULT_CONFIG.copy()
         try:
             with open(config_path, "r", encoding="utf-8") as f:
                 saved_config = json.load(f)
@@ -195,8 +230,11 @@ def load_config() -> Dict[str, Any]:
         except (json.JSONDecodeError, IOError) as e:
             # If config is corrupted, use defaults
             print(f"Warning: Could not load config: {e}")
+        entry = (cache_key, config)
+        _config_cache["entry"] = entry
 
-    return config
+    # Callers modify the returned dict, so hand out a copy
+    return copy.deepcopy(entry[1])
 
 
 def save_config(config: Dict[str, Any]) -> bool:
@@ -216,6 +254,7 @@ def save_config(config: Dict[str, Any]) -> bool:
 
         with open(config_path, "w", encoding="utf-8") as f:
             json.dump(config, f, indent=2)
+        _config_cache.clear()
         return True
     except IOError as e:
         print(f"Error saving config: {e}")
@@ -322,6 +361,22 @@ def get_default_model_path() -> Path:
     return Path.home() / ".cache" / "huggingface" / "hub"
 
 
+def configure_huggingface_env() -> None:
+    """Set HuggingFace download options for this process.
+
+    huggingface_hub reads these once, when it's first imported, so call this
+    before importing huggingface_hub or faster_whisper. setdefault keeps any
+    value the user set themselves.
+    """
+    # Progress bars can hang in windowed mode
+    os.environ.setdefault("HF_HUB_DISABLE_PROGRESS_BARS", "1")
+    os.environ.setdefault("HF_HUB_DISABLE_SYMLINKS_WARNING", "1")
+    # Use the multi-threaded Rust downloader when it's bundled
+    # (huggingface_hub raises if this is set without hf_transfer)
+    if importlib.util.find_spec("hf_transfer") is not None:
+        os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+
 def get_model_download_path() -> Optional[Path]:
     """Get the configured model download path, or None for default."""
     config = load_config()
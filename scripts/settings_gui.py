@@ -2,8 +2,12 @@
 Settings GUI for Whisper Tray.
 Provides a tabbed interface for configuring all application settings.
 """
+import functools
+import logging
 import os
+import subprocess
 import threading
+import time
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from typing import Callable, Dict, Any, Optional, List
@@ -12,7 +16,6 @@ import webbrowser
 import sounddevice as sd
 
 from pathlib import Path
-import shutil
 
 # Version info
 VERSION = "2.0.15"
@@ -21,14 +24,24 @@ GITHUB_URL = "https://github.com/BallParkBanter/whisper-tray"
 from config import (
     MODEL_INFO,
     LANGUAGES,
+    COMPUTE_TYPES,
     load_config,
     save_config,
     is_portable_mode,
     get_app_root,
     get_downloaded_models,
     mark_model_downloaded,
+    get_config_dir,
+    get_transcription_log_dir,
+    configure_huggingface_env,
 )
 
+logger = logging.getLogger("whisper_tray")
+
+# HuggingFace settings for model downloads, for when Settings runs on its own
+# (the tray app sets them at startup, before faster_whisper is imported)
+configure_huggingface_env()
+
 # Modern flat color scheme - matches wizard theme
 COLORS = {
     "bg": "#1e1e2e",           # Dark background
@@ -42,18 +55,131 @@ COLORS = {
     "status_text": "#c4b5fd",  # Lighter purple for status text
 }
 
+# Tk keysyms (lowercased) for modifier keys, mapped to hotkey names
+_KEYSYM_MODIFIERS = {
+    "control_l": "ctrl",
+    "control_r": "ctrl",
+    "alt_l": "alt",
+    "alt_r": "alt",
+    "shift_l": "shift",
+    "shift_r": "shift",
+}
+_HOTKEY_MODIFIERS = frozenset(_KEYSYM_MODIFIERS.values())
+
+# Animation frames for the download status label, padded to a fixed width
+_DOT_FRAMES = ("   ", ".  ", ".. ", "...")
+
+# Status label glyphs, as escapes so an editor re-encoding the file can't mangle them
+_HOURGLASS = "\u23f3"  # ⏳
+_CHECK = "\u2713"  # ✓
+_CROSS = "\u2717"  # ✗
+
 
 def get_huggingface_cache_path() -> Path:
-    """Get the actual HuggingFace cache path where models are stored."""
+    """Get the actual HuggingFace cache path where models are stored.
+
+    This is the shared cache other HuggingFace-based tools use too, so a model
+    they already downloaded isn't downloaded again.
+    """
     # HuggingFace uses these env vars in order of priority
-    if os.environ.get("HF_HOME"):
-        return Path(os.environ["HF_HOME"]) / "hub"
+    if os.environ.get("HF_HUB_CACHE"):
+        return Path(os.environ["HF_HUB_CACHE"])
     if os.environ.get("HUGGINGFACE_HUB_CACHE"):
         return Path(os.environ["HUGGINGFACE_HUB_CACHE"])
+    if os.environ.get("HF_HOME"):
+        return Path(os.environ["HF_HOME"]) / "hub"
     # Default location
     return Path.home() / ".cache" / "huggingface" / "hub"
 
 
+def get_model_repo_id(model_name: str) -> str:
+    """Get the HuggingFace repo that faster-whisper downloads a model from."""
+    return MODEL_INFO.get(model_name, {}).get("repo_id", f"Systran/faster-whisper-{model_name}")
+
+
+def get_model_cache_dir(model_name: str) -> Path:
+    """Get a model's folder in the HuggingFace cache (models--{org}--{repo})."""
+    return get_huggingface_cache_path() / f"models--{get_model_repo_id(model_name).replace('/', '--')}"
+
+
+def is_model_cached(model_name: str) -> bool:
+    """Check whether a model's weights are already in the HuggingFace cache."""
+    snapshots = get_model_cache_dir(model_name) / "snapshots"
+    try:
+        return any((snapshot / "model.bin").exists() for snapshot in snapshots.iterdir())
+    except OSError:
+        return False
+
+
+def _disabled_tqdm():
+    """Return a tqdm class that never draws (for snapshot_download's tqdm_class)."""
+    from tqdm.auto import tqdm
+
+    class DisabledTqdm(tqdm):
+        def __init__(self, *args, **kwargs):
+            kwargs["disable"] = True
+            super().__init__(*args, **kwargs)
+
+    return DisabledTqdm
+
+
+def _remove_tree(path: Path) -> None:
+    """Delete a directory tree with the OS's native command.
+
+    Much faster than shutil.rmtree on large HuggingFace caches. Meant to be
+    run from a background thread.
+    """
+    if os.name == "nt":
+        cmd = ["cmd", "/c", "rd", "/s", "/q", str(path)]
+    else:
+        cmd = ["rm", "-rf", str(path)]
+
+    # CREATE_NO_WINDOW prevents a console window from flashing
+    creationflags = subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+    result = subprocess.run(cmd, check=False, creationflags=creationflags)
+
+    # rd can exit 0 even when it couldn't delete everything, so check the path too
+    if result.returncode == 0 and not path.exists():
+        return
+    logger.warning("%s exited with %s for %s; deleting in-process", cmd[0], result.returncode, path)
+    try:
+        _fast_rmtree(path)
+    except OSError as exc:
+        # e.g. a file still locked by a loaded model - swept on the next open
+        logger.error("Could not delete %s: %s", path, exc)
+
+
+def _sweep_deleted_models() -> None:
+    """Delete model folders left over from earlier deletes that didn't finish.
+
+    _delete_model renames a model to "<name>.__del_<pid>_<ns>" before removing
+    it in the background; a failed or interrupted removal leaves that behind.
+    Meant to be run from a background thread.
+    """
+    try:
+        leftovers = list(get_huggingface_cache_path().glob("models--*.__del_*"))
+    except OSError:
+        return
+    for path in leftovers:
+        if path.is_dir():
+            _remove_tree(path)
+
+
+def _fast_rmtree(path) -> None:
+    """Delete a directory tree in-process.
+
+    Walks with os.scandir, whose entries carry the file type from the directory
+    listing, so no extra stat call is needed per file.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
 class SettingsWindow:
     """Settings window with tabbed interface."""
 
@@ -74,6 +200,14 @@ class SettingsWindow:
         self.on_save_callback = on_save_callback
         self.result = None  # Will be set to config dict if saved
 
+        # Config as saved on disk when the window opened. _save builds on this
+        # unless a download/delete changed downloaded_models since then.
+        self._config_on_open = load_config()
+        self._config_dirty_from_downloads = False
+
+        # Finish off any model deletes that failed last time
+        threading.Thread(target=_sweep_deleted_models, daemon=True).start()
+
         # Create window
         if parent:
             self.window = tk.Toplevel(parent)
@@ -157,6 +291,18 @@ class SettingsWindow:
         style.map("Secondary.TButton",
             background=[("active", COLORS["border"])])
 
+        # Link button - flat, underlined text that looks like a hyperlink
+        style.configure("Link.TButton",
+            background=COLORS["bg"],
+            foreground=COLORS["primary"],
+            font=("Segoe UI", 8, "underline"),
+            relief="flat",
+            borderwidth=0,
+            padding=0)
+        style.map("Link.TButton",
+            background=[("active", COLORS["bg"])],
+            foreground=[("active", COLORS["primary_hover"])])
+
         # Entry styling
         style.configure("TEntry",
             fieldbackground=COLORS["surface"],
@@ -268,12 +414,16 @@ class SettingsWindow:
         """Initialize tkinter variables for form fields."""
         self.var_model_size = tk.StringVar(value=self.current_config.get("model_size", "small"))
         self.var_language = tk.StringVar(value=self.current_config.get("language", "en"))
+        self.var_compute_type = tk.StringVar(value=self.current_config.get("compute_type") or "auto")
+        self.var_cpu_threads = tk.IntVar(value=self.current_config.get("cpu_threads", 0))
         self.var_hotkey = tk.StringVar(value=self.current_config.get("hotkey", "ctrl+alt+space"))
         self.var_input_device = tk.StringVar()
         self.var_send_enter = tk.BooleanVar(value=self.current_config.get("send_enter", True))
         self.var_keep_clipboard = tk.BooleanVar(value=self.current_config.get("keep_clipboard", False))
         self.var_use_typing = tk.BooleanVar(value=self.current_config.get("use_typing", False))
+        self.var_batch_typing = tk.BooleanVar(value=self.current_config.get("batch_typing", False))
         self.var_show_status = tk.BooleanVar(value=self.current_config.get("show_status_window", False))
+        self.var_vad_filter = tk.BooleanVar(value=self.current_config.get("vad_filter", True))
         self.var_model_path = tk.StringVar(value=self.current_config.get("model_download_path") or "")
 
         # New output settings
@@ -284,6 +434,26 @@ class SettingsWindow:
         self.var_transcription_window_on_top = tk.BooleanVar(value=self.current_config.get("transcription_window_always_on_top", True))
         self.var_history_length = tk.IntVar(value=self.current_config.get("history_length", 20))
 
+        # Config keys saved straight from their variables (language,
+        # compute_type, cpu_threads and input_device need parsing and are
+        # handled separately in _save)
+        self._save_map = [
+            ("model_size", self.var_model_size),
+            ("hotkey", self.var_hotkey),
+            ("send_enter", self.var_send_enter),
+            ("keep_clipboard", self.var_keep_clipboard),
+            ("use_typing", self.var_use_typing),
+            ("batch_typing", self.var_batch_typing),
+            ("show_status_window", self.var_show_status),
+            ("vad_filter", self.var_vad_filter),
+            ("save_transcription_log", self.var_save_log),
+            ("auto_copy_to_clipboard", self.var_auto_copy),
+            ("show_toast_notifications", self.var_show_toast),
+            ("show_transcription_window", self.var_show_transcription_window),
+            ("transcription_window_always_on_top", self.var_transcription_window_on_top),
+            ("history_length", self.var_history_length),
+        ]
+
         # Get available audio devices
         self.audio_devices = self._get_audio_devices()
         current_device = self.current_config.get("input_device")
@@ -353,7 +523,7 @@ class SettingsWindow:
         model_frame.grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=(0, 15))
 
         # Get list of downloaded models
-        downloaded_models = get_downloaded_models()
+        downloaded_models = self._config_on_open.get("downloaded_models", [])
 
         # Store radio buttons for potential refresh
         self.model_radiobuttons = []
@@ -381,15 +551,13 @@ class SettingsWindow:
         legend_frame.grid(row=2, column=0, sticky=tk.W)
         ttk.Label(legend_frame, text="* Recommended", font=("", 8)).pack(side=tk.LEFT)
         ttk.Label(legend_frame, text="  |  ", font=("", 8)).pack(side=tk.LEFT)
-        go_to_models = ttk.Label(
+        ttk.Button(
             legend_frame,
             text="Download more models →",
-            font=("", 8, "underline"),
-            foreground=COLORS["primary"],
+            style="Link.TButton",
             cursor="hand2",
-        )
-        go_to_models.pack(side=tk.LEFT)
-        go_to_models.bind("<Button-1>", lambda e: self.notebook.select(4))  # Models tab is index 4
+            command=functools.partial(self.notebook.select, 4),  # Models tab is index 4
+        ).pack(side=tk.LEFT)
 
         # Language
         ttk.Label(frame, text="Language:", font=("", 9, "bold")).grid(
@@ -424,6 +592,41 @@ class SettingsWindow:
             side=tk.LEFT, padx=(10, 0)
         )
 
+        # Compute type
+        ttk.Label(frame, text="Compute Type:", font=("", 9, "bold")).grid(
+            row=7, column=0, sticky=tk.W, pady=(15, 5)
+        )
+
+        ttk.Combobox(
+            frame,
+            textvariable=self.var_compute_type,
+            values=["auto"] + COMPUTE_TYPES,
+            state="readonly",
+            width=30,
+        ).grid(row=8, column=0, sticky=tk.W)
+        ttk.Label(
+            frame,
+            text="auto = int8 on CPU, int8_float16 on NVIDIA GPUs",
+            font=("", 8),
+            foreground="gray",
+        ).grid(row=9, column=0, sticky=tk.W)
+
+        # CPU threads
+        threads_frame = ttk.Frame(frame)
+        threads_frame.grid(row=10, column=0, sticky=tk.W, pady=(15, 0))
+
+        ttk.Label(threads_frame, text="CPU Threads:", font=("", 9, "bold")).pack(side=tk.LEFT)
+        ttk.Spinbox(
+            threads_frame,
+            from_=0,
+            to=os.cpu_count() or 1,
+            width=5,
+            textvariable=self.var_cpu_threads,
+        ).pack(side=tk.LEFT, padx=(10, 0))
+        ttk.Label(threads_frame, text="0 = one per physical core", font=("", 8), foreground="gray").pack(
+            side=tk.LEFT, padx=(10, 0)
+        )
+
     def _create_audio_tab(self, parent):
         """Create the Audio settings tab."""
         frame = ttk.Frame(parent, padding=10)
@@ -434,14 +637,14 @@ class SettingsWindow:
             row=0, column=0, sticky=tk.W, pady=(0, 5), columnspan=2
         )
 
-        device_combo = ttk.Combobox(
+        self.input_device_combo = ttk.Combobox(
             frame,
             textvariable=self.var_input_device,
             values=self.audio_devices,
             state="readonly",
             width=38,  # Reduced from 45 to fit Refresh button
         )
-        device_combo.grid(row=1, column=0, sticky=tk.W, pady=(0, 10))
+        self.input_device_combo.grid(row=1, column=0, sticky=tk.W, pady=(0, 10))
 
         # Refresh button
         ttk.Button(frame, text="Refresh", command=self._refresh_devices, style="Secondary.TButton").grid(
@@ -494,12 +697,24 @@ class SettingsWindow:
             variable=self.var_use_typing,
         ).pack(anchor=tk.W, pady=5)
 
+        ttk.Checkbutton(
+            frame,
+            text="Fast typing (send all text at once - some remote desktops/VMs ignore it)",
+            variable=self.var_batch_typing,
+        ).pack(anchor=tk.W, padx=(20, 0), pady=5)
+
         ttk.Checkbutton(
             frame,
             text="Show status window (always-on-top indicator)",
             variable=self.var_show_status,
         ).pack(anchor=tk.W, pady=5)
 
+        ttk.Checkbutton(
+            frame,
+            text="Skip silence before transcribing (faster)",
+            variable=self.var_vad_filter,
+        ).pack(anchor=tk.W, pady=5)
+
         # Explanations
         ttk.Label(
             frame,
@@ -511,7 +726,9 @@ class SettingsWindow:
             "- Enter: Automatically press Enter after pasting transcription",
             "- Clipboard: Preserves your clipboard instead of using it for paste",
             "- Typing mode: Types character-by-character (works in terminals)",
+            "- Fast typing: Types in one batch of Unicode input instead of key presses",
             "- Status window: Shows recording/transcribing status on screen",
+            "- Skip silence: Removes pauses so Whisper only decodes speech",
         ]
         for exp in explanations:
             ttk.Label(frame, text=exp, font=("", 8), foreground="gray").pack(anchor=tk.W)
@@ -604,7 +821,6 @@ class SettingsWindow:
         ).pack(anchor=tk.W, padx=(10, 0))
 
         # Config/logs location
-        from config import get_config_dir, get_transcription_log_dir
         config_dir = get_config_dir()
         ttk.Label(frame, text="Settings & Logs:", font=("Segoe UI", 9, "bold")).pack(anchor=tk.W, pady=(10, 0))
         ttk.Label(
@@ -629,7 +845,7 @@ class SettingsWindow:
         ttk.Label(frame, text="Model Manager", style="Title.TLabel").pack(anchor=tk.W)
         ttk.Label(
             frame,
-            text="Download or delete models. ✓ = downloaded, * = recommended",
+            text=f"Download or delete models. {_CHECK} = downloaded, * = recommended",
             style="Subtitle.TLabel",
         ).pack(anchor=tk.W, pady=(0, 5))
 
@@ -756,7 +972,7 @@ class SettingsWindow:
 
             # Status indicator
             is_downloaded = model_name in downloaded
-            status = "✓" if is_downloaded else "  "
+            status = _CHECK if is_downloaded else "  "
             rec = " *" if info.get("recommended") else ""
 
             # Model info label
@@ -803,83 +1019,103 @@ class SettingsWindow:
             expected_mb = 100
 
         # Show immediate feedback - update status label
-        status_text = f"⏳ Starting download of {model_name} (~{expected_mb:.0f} MB)..."
+        status_text = f"{_HOURGLASS} Starting download of {model_name} (~{expected_mb:.0f} MB)..."
         self.storage_status.configure(text=status_text, fg=COLORS["primary"])
         self.window.update_idletasks()
-        self.window.update()
 
         # Track download state
-        self._download_active = True
         self._download_model_name = model_name
         self._download_expected_mb = expected_mb
 
         # Animated dots for progress
         self._dot_count = 0
 
-        def update_progress():
-            """Update status with animated dots and check for completion."""
-            # Check if download finished
-            if not self._download_active:
-                # Download finished - show result
-                if hasattr(self, '_download_success'):
-                    if self._download_success:
-                        self.storage_status.configure(
-                            text=f"✓ {self._download_model_name} downloaded successfully!",
-                            fg=COLORS["success"]
-                        )
-                    else:
-                        error_msg = self._download_error[:50] + "..." if len(self._download_error) > 50 else self._download_error
-                        self.storage_status.configure(
-                            text=f"✗ Failed: {error_msg}",
-                            fg="#ef4444"
-                        )
-                    self._refresh_model_list()
-                return
-
-            # Still downloading - show animated progress
-            self._dot_count = (self._dot_count + 1) % 4
-            dots = "." * self._dot_count + " " * (3 - self._dot_count)
-            self.storage_status.configure(
-                text=f"⏳ Downloading {self._download_model_name} (~{self._download_expected_mb:.0f} MB){dots}",
-                fg=COLORS["status_text"]
-            )
-            # Schedule next update
-            self.window.after(500, update_progress)
-
         def do_download():
             try:
-                # Use faster_whisper directly (bundled in EXE) - same as wizard
-                # Disable HuggingFace progress bars (can hang in windowed mode)
-                os.environ["HF_HUB_DISABLE_PROGRESS_BARS"] = "1"
-                os.environ["HF_HUB_DISABLE_SYMLINKS_WARNING"] = "1"
-
-                # Import faster_whisper (bundled in the EXE)
-                from faster_whisper import WhisperModel
-
-                # Load model - this triggers download if not cached
-                # Use CPU directly - CUDA detection can hang on non-CUDA systems
-                model = WhisperModel(model_name, device="cpu", compute_type="int8")
-                del model  # Release memory
+                # Already in the cache (e.g. downloaded before, or by the wizard) -
+                # no need to load huggingface_hub at all
+                if is_model_cached(model_name):
+                    mark_model_downloaded(model_name)
+                    # Set here, not in _finish_download: a Save before that
+                    # runs must still re-read the config just written
+                    self._config_dirty_from_downloads = True
+                    self._post(self._finish_download, True, "")
+                    return
+
+                # Fetch the model files straight into the HuggingFace cache.
+                # Don't construct a WhisperModel here - that loads the weights
+                # into RAM just to throw them away.
+                from huggingface_hub import snapshot_download
+
+                # Download into the shared cache (no local_dir), so the blobs are
+                # reused by faster-whisper and any other HuggingFace tool
+                snapshot_download(
+                    repo_id=get_model_repo_id(model_name),
+                    cache_dir=get_huggingface_cache_path(),
+                    allow_patterns=[
+                        "config.json",
+                        "preprocessor_config.json",
+                        "model.bin",
+                        "tokenizer.json",
+                        "vocabulary.*",
+                    ],
+                    # The overall "Fetching N files" bar ignores
+                    # HF_HUB_DISABLE_PROGRESS_BARS and would write to a
+                    # missing stderr in the windowed EXE
+                    tqdm_class=_disabled_tqdm(),
+                )
 
                 # Mark as downloaded
                 mark_model_downloaded(model_name)
-                self._download_active = False
-                self._download_success = True
-                self._download_error = ""
+                self._config_dirty_from_downloads = True
+                self._post(self._finish_download, True, "")
 
             except Exception as e:
-                self._download_active = False
-                self._download_success = False
-                self._download_error = str(e)
+                self._post(self._finish_download, False, str(e))
 
-        # Initialize completion flags
-        self._download_success = False
-        self._download_error = ""
-
-        # Start progress updates and download thread
-        self.window.after(500, update_progress)
+        # Start progress animation and download thread
+        self._dots_after_id = self.window.after(500, self._animate_dots)
         threading.Thread(target=do_download, daemon=True).start()
 
+    def _post(self, func, *args):
+        """Schedule func on the Tk thread from a worker thread.
+
+        The user may close Settings while a long download is running; the
+        result is then dropped instead of raising in the worker.
+        """
+        try:
+            self.window.after(0, func, *args)
+        except (RuntimeError, tk.TclError):
+            pass  # Window closed in the meantime
+
+    def _animate_dots(self):
+        """Animate the download status label while a download is running."""
+        self._dot_count = (self._dot_count + 1) % len(_DOT_FRAMES)
+        dots = _DOT_FRAMES[self._dot_count]
+        self.storage_status.configure(
+            text=f"{_HOURGLASS} Downloading {self._download_model_name} (~{self._download_expected_mb:.0f} MB){dots}",
+            fg=COLORS["status_text"]
+        )
+        # Schedule next frame
+        self._dots_after_id = self.window.after(500, self._animate_dots)
+
+    def _finish_download(self, success: bool, error: str):
+        """Show the download result. Runs on the Tk thread, posted by the worker."""
+        self.window.after_cancel(self._dots_after_id)
+
+        if success:
+            self.storage_status.configure(
+                text=f"{_CHECK} {self._download_model_name} downloaded successfully!",
+                fg=COLORS["success"]
+            )
+        else:
+            error_msg = error[:50] + "..." if len(error) > 50 else error
+            self.storage_status.configure(
+                text=f"{_CROSS} Failed: {error_msg}",
+                fg="#ef4444"
+            )
+        self._refresh_model_list()
+
     def _delete_model(self, model_name: str):
         """Delete a downloaded model."""
         if not messagebox.askyesno(
@@ -891,14 +1127,19 @@ class SettingsWindow:
 
         try:
             # Models are in HuggingFace cache
-            hf_cache = get_huggingface_cache_path()
-
-            # HuggingFace stores models as: models--Systran--faster-whisper-{model}
-            model_dir = hf_cache / f"models--Systran--faster-whisper-{model_name}"
+            model_dir = get_model_cache_dir(model_name)
 
             deleted = False
             if model_dir.exists():
-                shutil.rmtree(model_dir)
+                # Rename first so the model is gone instantly, then delete the
+                # files in the background so the window doesn't freeze
+                tmp_dir = model_dir.with_name(f"{model_dir.name}.__del_{os.getpid()}_{time.time_ns()}")
+                try:
+                    model_dir.rename(tmp_dir)
+                except OSError:
+                    _fast_rmtree(model_dir)
+                else:
+                    threading.Thread(target=_remove_tree, args=(tmp_dir,), daemon=True).start()
                 deleted = True
 
             # Remove from downloaded list in config
@@ -906,31 +1147,23 @@ class SettingsWindow:
             if "downloaded_models" in config and model_name in config["downloaded_models"]:
                 config["downloaded_models"].remove(model_name)
                 save_config(config)
+                self._config_dirty_from_downloads = True
 
             if deleted:
-                self.storage_status.configure(text=f"✓ {model_name} deleted", fg=COLORS["success"])
+                self.storage_status.configure(text=f"{_CHECK} {model_name} deleted", fg=COLORS["success"])
             else:
                 # Still remove from config even if files not found
-                self.storage_status.configure(text=f"✓ {model_name} removed from list", fg=COLORS["success"])
+                self.storage_status.configure(text=f"{_CHECK} {model_name} removed from list", fg=COLORS["success"])
 
             self._refresh_model_list()
 
         except Exception as e:
-            self.storage_status.configure(text=f"✗ Failed to delete: {e}", fg="#ef4444")
+            self.storage_status.configure(text=f"{_CROSS} Failed to delete: {e}", fg="#ef4444")
 
     def _refresh_devices(self):
         """Refresh the list of audio devices."""
         self.audio_devices = self._get_audio_devices()
-        # Update combobox
-        for widget in self.window.winfo_children():
-            self._update_device_combo(widget)
-
-    def _update_device_combo(self, widget):
-        """Recursively find and update device combobox."""
-        if isinstance(widget, ttk.Combobox) and widget.cget("textvariable") == str(self.var_input_device):
-            widget.configure(values=self.audio_devices)
-        for child in widget.winfo_children():
-            self._update_device_combo(child)
+        self.input_device_combo.configure(values=self.audio_devices)
 
     def _capture_hotkey(self):
         """Open dialog to capture a new hotkey."""
@@ -956,27 +1189,15 @@ class SettingsWindow:
 
         def on_key_press(event):
             key = event.keysym.lower()
-            if key in ("control_l", "control_r"):
-                self.captured_keys.add("ctrl")
-            elif key in ("alt_l", "alt_r"):
-                self.captured_keys.add("alt")
-            elif key in ("shift_l", "shift_r"):
-                self.captured_keys.add("shift")
-            else:
-                self.captured_keys.add(key)
+            self.captured_keys.add(_KEYSYM_MODIFIERS.get(key, key))
 
         def on_key_release(event):
             if len(self.captured_keys) >= 2:
                 # Build hotkey string
-                modifiers = []
-                key = None
-                for k in self.captured_keys:
-                    if k in ("ctrl", "alt", "shift"):
-                        modifiers.append(k)
-                    else:
-                        key = k
-                if modifiers and key:
-                    hotkey = "+".join(sorted(modifiers) + [key])
+                modifiers = sorted(k for k in self.captured_keys if k in _HOTKEY_MODIFIERS)
+                keys = [k for k in self.captured_keys if k not in _HOTKEY_MODIFIERS]
+                if modifiers and keys:
+                    hotkey = "+".join(modifiers + [keys[-1]])
                     self.var_hotkey.set(hotkey)
                     capture_window.destroy()
 
@@ -989,6 +1210,10 @@ class SettingsWindow:
         self.test_btn.configure(state="disabled")
         self.test_status.configure(text="Recording...")
 
+        # Lets a playback watcher from an earlier test know it's been superseded
+        self._test_generation = getattr(self, "_test_generation", 0) + 1
+        generation = self._test_generation
+
         def do_test():
             try:
                 # Get selected device index
@@ -1009,29 +1234,47 @@ class SettingsWindow:
                 # Update status
                 self.window.after(0, lambda: self.test_status.configure(text="Playing..."))
 
-                # Play back
+                # Play back without waiting - the button is released as soon as
+                # playback starts, and the watcher reports when it's done
                 sd.play(audio, samplerate=samplerate)
-                sd.wait()
-
-                self.window.after(0, lambda: self.test_status.configure(text="Done!"))
+                self.window.after(100, self._watch_test_playback, generation)
             except Exception as e:
+                error = str(e)
                 self.window.after(
-                    0, lambda: self.test_status.configure(text=f"Error: {str(e)[:30]}")
+                    0, lambda: self.test_status.configure(text=f"Error: {error[:30]}")
                 )
             finally:
                 self.window.after(0, lambda: self.test_btn.configure(state="normal"))
 
         threading.Thread(target=do_test, daemon=True).start()
 
+    def _watch_test_playback(self, generation: int):
+        """Show "Done!" once the test playback has finished."""
+        if generation != self._test_generation:
+            return  # A newer test has taken over
+
+        try:
+            playing = sd.get_stream().active
+        except RuntimeError:
+            playing = False
+
+        if playing:
+            self.window.after(100, self._watch_test_playback, generation)
+        else:
+            self.test_status.configure(text="Done!")
+
     # Model path browse/reset removed - faster-whisper always uses HuggingFace cache
 
     def _save(self):
         """Save settings and close window."""
-        # Build config dict - start with FRESH config from disk
-        # This preserves downloaded_models that were added during this session
-        new_config = load_config()
+        # Build config dict - start from the config on disk. Only re-read it if
+        # downloaded_models changed during this session.
+        if self._config_dirty_from_downloads:
+            new_config = load_config()
+        else:
+            new_config = dict(self._config_on_open)
 
-        new_config["model_size"] = self.var_model_size.get()
+        new_config.update({key: var.get() for key, var in self._save_map})
 
         # Extract language code from combo value
         lang_value = self.var_language.get()
@@ -1040,7 +1283,16 @@ class SettingsWindow:
         else:
             new_config["language"] = lang_value
 
-        new_config["hotkey"] = self.var_hotkey.get()
+        # "auto" is stored as None so the app picks a type for the device
+        compute_type = self.var_compute_type.get()
+        new_config["compute_type"] = None if compute_type == "auto" else compute_type
+
+        # The CPU threads spinbox accepts free text - fall back to 0 (auto)
+        try:
+            cpu_threads = int(self.var_cpu_threads.get())
+        except (tk.TclError, ValueError):
+            cpu_threads = 0
+        new_config["cpu_threads"] = min(max(cpu_threads, 0), os.cpu_count() or 1)
 
         # Extract device index
         device_str = self.var_input_device.get()
@@ -1052,19 +1304,6 @@ class SettingsWindow:
         else:
             new_config["input_device"] = None
 
-        new_config["send_enter"] = self.var_send_enter.get()
-        new_config["keep_clipboard"] = self.var_keep_clipboard.get()
-        new_config["use_typing"] = self.var_use_typing.get()
-        new_config["show_status_window"] = self.var_show_status.get()
-
-        # Output settings
-        new_config["save_transcription_log"] = self.var_save_log.get()
-        new_config["auto_copy_to_clipboard"] = self.var_auto_copy.get()
-        new_config["show_toast_notifications"] = self.var_show_toast.get()
-        new_config["show_transcription_window"] = self.var_show_transcription_window.get()
-        new_config["transcription_window_always_on_top"] = self.var_transcription_window_on_top.get()
-        new_config["history_length"] = self.var_history_length.get()
-
         # Model path removed - faster-whisper always uses HuggingFace cache
 
         # Save to file
@@ -8,24 +8,41 @@ from datetime import datetime
 from typing import Optional, Callable
 import threading
 
+# Long transcriptions are inserted into the text area in pieces of this size
+_INSERT_CHUNK_SIZE = 4096
+# Let Tk redraw after inserting this many characters
+_IDLE_FLUSH_SIZE = 4 * _INSERT_CHUNK_SIZE
 
-class TranscriptionWindow:
-    """Floating window that shows transcriptions in real-time."""
 
-    def __init__(self, always_on_top: bool = True, on_close: Optional[Callable] = None):
+class TranscriptionWindow:
+    """Floating window that shows transcriptions in real-time.
+
+    Tk is not thread-safe: every method must run on the thread that created
+    the window. Other threads should schedule calls with self.window.after(0, ...).
+    """
+
+    def __init__(
+        self,
+        always_on_top: bool = True,
+        on_close: Optional[Callable] = None,
+        history_length: int = 20,
+    ):
         """Initialize the transcription window.
 
         Args:
             always_on_top: Keep window above other windows
             on_close: Callback when window is closed
+            history_length: Maximum number of lines kept in the text area
         """
         self.on_close_callback = on_close
         self.always_on_top = always_on_top
+        self.max_lines = history_length
         self.window = None
         self.text_area = None
         self.status_label = None
         self.is_open = False
-        self._lock = threading.Lock()
+        self._tk_thread: Optional[threading.Thread] = None  # Thread that owns the Tk window
+        self._has_status_line = False  # Whether the "status_line" mark points at a removable line
 
     def show(self):
         """Show the transcription window."""
@@ -43,6 +60,7 @@ class TranscriptionWindow:
     def _create_window(self):
         """Create the window UI."""
         self.window = tk.Tk()
+        self._tk_thread = threading.current_thread()
         self.window.title("Whisper Transcription")
         self.window.geometry("500x350")
         self.window.minsize(400, 200)
@@ -122,6 +140,7 @@ class TranscriptionWindow:
             self.text_area.configure(state='normal')
             self.text_area.delete(1.0, tk.END)
             self.text_area.configure(state='disabled')
+            self._has_status_line = False
 
     def _copy_all(self):
         """Copy all transcriptions to clipboard."""
@@ -145,20 +164,23 @@ class TranscriptionWindow:
         """Update the status label."""
         if self.status_label and self.window:
             try:
-                self.window.after(0, lambda: self.status_label.configure(text=status))
+                if threading.current_thread() is self._tk_thread:
+                    self.status_label.configure(text=status)
+                else:
+                    self.window.after(0, lambda: self.status_label.configure(text=status))
             except tk.TclError:
                 pass
 
     def show_recording(self):
         """Show recording indicator."""
-        self._append_text("● Recording...", tag="recording", add_timestamp=True)
+        self._append_text("● Recording...", tag="recording", add_timestamp=True, is_status=True)
         self.set_status("Recording...")
 
     def show_transcribing(self):
         """Show transcribing indicator."""
         # Remove the recording indicator and replace with transcribing
         self._remove_last_line()
-        self._append_text("◐ Transcribing...", tag="transcribing", add_timestamp=True)
+        self._append_text("◐ Transcribing...", tag="transcribing", add_timestamp=True, is_status=True)
         self.set_status("Transcribing...")
 
     def show_transcription(self, text: str):
@@ -174,14 +196,10 @@ class TranscriptionWindow:
         self._append_text(text, tag="text", add_timestamp=True)
         self.set_status("Ready")
 
-        # Scroll to bottom
-        if self.text_area:
-            self.text_area.see(tk.END)
-
     def show_cancelled(self):
         """Show that recording was cancelled."""
         self._remove_last_line()
-        self._append_text("(cancelled)", tag="timestamp", add_timestamp=True)
+        self._append_text("(cancelled)", tag="timestamp", add_timestamp=True, is_status=True)
         self.set_status("Cancelled")
 
     def show_error(self, message: str):
@@ -190,13 +208,14 @@ class TranscriptionWindow:
         self._append_text(f"Error: {message}", tag="recording", add_timestamp=True)
         self.set_status("Error")
 
-    def _append_text(self, text: str, tag: str = "text", add_timestamp: bool = False):
+    def _append_text(self, text: str, tag: str = "text", add_timestamp: bool = False, is_status: bool = False):
         """Append text to the text area.
 
         Args:
             text: Text to append
             tag: Tag for styling
             add_timestamp: Whether to add a timestamp prefix
+            is_status: Whether this is a status line the next update replaces
         """
         if not self.text_area or not self.window:
             return
@@ -204,33 +223,46 @@ class TranscriptionWindow:
         try:
             self.text_area.configure(state='normal')
 
+            if is_status:
+                # Mark the start of the new line; left gravity keeps the mark
+                # in front of the text inserted below
+                self.text_area.mark_set("status_line", "end-1c")
+                self.text_area.mark_gravity("status_line", tk.LEFT)
+            self._has_status_line = is_status
+
             if add_timestamp:
                 timestamp = datetime.now().strftime("[%H:%M:%S] ")
                 self.text_area.insert(tk.END, timestamp, "timestamp")
 
-            self.text_area.insert(tk.END, text + "\n", tag)
+            # Insert long text in chunks, flushing redraws in between so the
+            # window stays responsive
+            text += "\n"
+            for i in range(0, len(text), _INSERT_CHUNK_SIZE):
+                if i and i % _IDLE_FLUSH_SIZE == 0:
+                    self.text_area.update_idletasks()
+                self.text_area.insert(tk.END, text[i:i + _INSERT_CHUNK_SIZE], tag)
+
+            # Drop the oldest lines so the buffer doesn't grow forever
+            # ("end-1c" is the empty line after the last newline)
+            line_count = int(self.text_area.index("end-1c").split(".")[0])
+            if line_count > self.max_lines:
+                self.text_area.delete("1.0", f"{line_count - self.max_lines}.0")
+
             self.text_area.configure(state='disabled')
             self.text_area.see(tk.END)
         except tk.TclError:
             pass
 
     def _remove_last_line(self):
-        """Remove the last line from the text area."""
-        if not self.text_area or not self.window:
+        """Remove the last line if it's a status line (Recording/Transcribing/cancelled)."""
+        if not self.text_area or not self.window or not self._has_status_line:
             return
 
         try:
             self.text_area.configure(state='normal')
-            # Get the last line
-            last_line_start = self.text_area.index("end-2l linestart")
-            last_line_end = self.text_area.index("end-1l lineend")
-            content = self.text_area.get(last_line_start, last_line_end).strip()
-
-            # Only remove if it's a status line (Recording/Transcribing/cancelled)
-            if "Recording" in content or "Transcribing" in content or "cancelled" in content:
-                self.text_area.delete(last_line_start, tk.END)
-
+            self.text_area.delete("status_line", tk.END)
             self.text_area.configure(state='disabled')
+            self._has_status_line = False
         except tk.TclError:
             pass
 
@@ -257,6 +289,7 @@ class TranscriptionWindowManager:
         self._lock = threading.Lock()
         self.enabled = False
         self.always_on_top = True
+        self.history_length = 20
 
     def set_enabled(self, enabled: bool):
         """Enable or disable the transcription window."""
@@ -270,6 +303,12 @@ class TranscriptionWindowManager:
         if self.window:
             self.window.always_on_top = value
 
+    def set_history_length(self, value: int):
+        """Set how many lines the window keeps."""
+        self.history_length = value
+        if self.window:
+            self.window.max_lines = value
+
     def show(self):
         """Show the transcription window."""
         if not self.enabled:
@@ -282,7 +321,8 @@ class TranscriptionWindowManager:
             # Create window in main thread context
             self.window = TranscriptionWindow(
                 always_on_top=self.always_on_top,
-                on_close=self._on_window_close
+                on_close=self._on_window_close,
+                history_length=self.history_length,
             )
             self.window.show()
 
@@ -304,27 +344,38 @@ class TranscriptionWindowManager:
             return
         self.show()
         if self.window:
-            self.window.show_recording()
+            self._post(self.window.show_recording)
 
     def on_transcribing(self):
         """Called when transcription starts."""
         if self.window:
-            self.window.show_transcribing()
+            self._post(self.window.show_transcribing)
 
     def on_transcription_complete(self, text: str):
         """Called when transcription is complete."""
         if self.window:
-            self.window.show_transcription(text)
+            self._post(self.window.show_transcription, text)
 
     def on_recording_cancelled(self):
         """Called when recording is cancelled."""
         if self.window:
-            self.window.show_cancelled()
+            self._post(self.window.show_cancelled)
 
     def on_error(self, message: str):
         """Called when an error occurs."""
         if self.window:
-            self.window.show_error(message)
+            self._post(self.window.show_error, message)
+
+    def _post(self, func: Callable, *args):
+        """Schedule a window update on the Tk thread.
+
+        These callbacks arrive from the recording/transcription threads, which
+        must not touch Tk widgets directly.
+        """
+        try:
+            self.window.window.after(0, func, *args)
+        except (AttributeError, RuntimeError, tk.TclError):
+            pass  # Window closed in the meantime
 
     def update(self):
         """Update the window (call from main thread)."""
@@ -4,24 +4,26 @@ Windows tray app that records speech, transcribes it with Whisper, and types the
 result into the active window (e.g. a Codex terminal).
 """
 import argparse
+import base64
 import contextlib
 import ctypes
+from ctypes import wintypes
+import hashlib
+import io
 import os
+import queue
 import sys
 import threading
 import time
-import tkinter as tk
+import types
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import logging
 import numpy as np
 # pyautogui imported lazily in WhisperTray.__init__ to avoid DPI issues during wizard
-import pyperclip
 import sounddevice as sd
-from faster_whisper import WhisperModel
-from PIL import Image, ImageDraw, ImageFont
-import pystray
 import keyboard
 try:
     from winotify import Notification as WinNotification
@@ -29,6 +31,7 @@ except Exception:  # pragma: no cover
     WinNotification = None
 
 # Import our modules
+import clipboard
 from config import (
     load_config,
     save_config,
@@ -39,15 +42,56 @@ from config import (
     get_transcription_log_dir,
     get_todays_transcriptions,
     get_downloaded_models,
+    get_config_dir,
+    configure_huggingface_env,
+    MODEL_INFO,
 )
-from errors import handle_error, get_audio_quality_message, classify_error, get_friendly_error
-from transcription_window import get_transcription_window_manager
+from errors import (
+    handle_error,
+    get_audio_quality_message,
+    is_silent_audio,
+    classify_error,
+    get_friendly_error,
+)
+
+# Heavy imports (faster_whisper pulls in CTranslate2, plus PIL, pystray and
+# tkinter) are deferred to the code that needs them, so the first-run wizard
+# and --list-devices start quickly
+if TYPE_CHECKING:
+    import pystray
+    from faster_whisper import WhisperModel
+    from PIL import Image
+
+# huggingface_hub reads its download settings once, when it's first imported
+# (through faster_whisper in _load_model), so they're set here
+configure_huggingface_env()
 
 
 APP_ID = "WhisperDictation"
+MODEL_CACHE_SIZE = 2  # Loaded models kept for quick switching in Settings
 ICON_FILE = Path(__file__).with_name("whisper_icon.png")
 logger = logging.getLogger("whisper_tray")
 
+# MessageBoxW flags and results
+MB_ICONERROR = 0x00000010
+MB_YESNO_QUESTION = 0x00000024  # MB_YESNO | MB_ICONQUESTION
+MB_ICONINFORMATION = 0x00000040
+IDYES = 6
+
+# Win32 functions resolved once with explicit prototypes, so ctypes doesn't
+# guess argument types or truncate returned handles to 32-bit ints. A private
+# WinDLL instance keeps these prototypes from clashing with other libraries
+# that use ctypes.windll.
+_user32 = ctypes.WinDLL("user32", use_last_error=True)
+
+_MessageBoxW = _user32.MessageBoxW
+_MessageBoxW.argtypes = [wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.UINT]
+_MessageBoxW.restype = ctypes.c_int
+
+_GetForegroundWindow = _user32.GetForegroundWindow
+_GetForegroundWindow.argtypes = []
+_GetForegroundWindow.restype = wintypes.HWND
+
 
 def set_app_id(app_id: str = APP_ID):
     try:
@@ -67,7 +111,9 @@ def configure_logging():
     logger.info("Logging initialized at %s", log_path)
 
 
-def create_icon(color: str, radius: int = 12, label: str = "W", shape: str = "circle") -> Image.Image:
+def create_icon(color: str, radius: int = 12, label: str = "W", shape: str = "circle") -> "Image.Image":
+    from PIL import Image, ImageDraw
+
     size = 64
     image = Image.new("RGBA", (size, size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(image)
@@ -97,13 +143,196 @@ def create_icon(color: str, radius: int = 12, label: str = "W", shape: str = "ci
     return image
 
 
+def audio_stats(audio: np.ndarray) -> tuple:
+    """Return (peak, mean) absolute amplitude of a recording.
+
+    Takes the absolute value once and reduces that one array, instead of
+    building a separate |audio| temporary for each statistic.
+    """
+    magnitude = np.abs(audio)
+    return float(magnitude.max()), float(magnitude.mean())
+
+
+# SendInput structures for typing mode (see send_unicode_text)
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class MOUSEINPUT(ctypes.Structure):
+    # Only here so the INPUT union has its full native size
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("ki", KEYBDINPUT), ("mi", MOUSEINPUT)]
+
+
+class INPUT(ctypes.Structure):
+    _fields_ = [("type", wintypes.DWORD), ("union", _INPUTUNION)]
+
+
+_SendInput = _user32.SendInput
+_SendInput.argtypes = [wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int]
+_SendInput.restype = wintypes.UINT
+
+
+def send_unicode_text(text: str) -> bool:
+    """Type text with a single SendInput call.
+
+    Each UTF-16 code unit becomes a KEYEVENTF_UNICODE key down/up pair, so the
+    whole string goes to the focused window in one batch instead of one call
+    (and one Python round-trip) per character.
+
+    Returns:
+        True if the input was queued, False if it was blocked (e.g. by UIPI)
+    """
+    units = text.encode("utf-16-le")
+    codes = [int.from_bytes(units[i:i + 2], "little") for i in range(0, len(units), 2)]
+    inputs = (INPUT * (2 * len(codes)))()
+    for i, code in enumerate(codes):
+        for j, flags in enumerate((KEYEVENTF_UNICODE, KEYEVENTF_UNICODE | KEYEVENTF_KEYUP)):
+            event = inputs[2 * i + j]
+            event.type = INPUT_KEYBOARD
+            event.union.ki.wScan = code
+            event.union.ki.dwFlags = flags
+    sent = _SendInput(len(inputs), inputs, ctypes.sizeof(INPUT))
+    return sent > 0
+
+
+def wait_focus_stable(timeout: float, interval: float = 0.005) -> None:
+    """Wait until the foreground window is the same on two consecutive reads.
+
+    Replaces a fixed sleep before typing: focus has normally settled long
+    before the timeout, which stays as an upper bound.
+    """
+    deadline = time.monotonic() + timeout
+    previous = _GetForegroundWindow()
+    while time.monotonic() < deadline:
+        time.sleep(interval)
+        current = _GetForegroundWindow()
+        if current and current == previous:
+            return
+        previous = current
+
+
+def get_physical_cores() -> int:
+    """Count physical CPU cores.
+
+    Hyperthreads share a core's math units, so CTranslate2's int8 matrix
+    multiplies run best with one thread per physical core. Returns 0 (let
+    CTranslate2 choose) if Windows can't report the core count.
+    """
+    RelationProcessorCore = 0
+    try:
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        get_info = kernel32.GetLogicalProcessorInformationEx
+        get_info.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.POINTER(wintypes.DWORD)]
+        get_info.restype = wintypes.BOOL
+
+        # First call only reports the buffer size needed
+        length = wintypes.DWORD(0)
+        get_info(RelationProcessorCore, None, ctypes.byref(length))
+        buffer = ctypes.create_string_buffer(length.value)
+        if not get_info(RelationProcessorCore, buffer, ctypes.byref(length)):
+            return 0
+
+        # Variable-size records, each starting with (Relationship, Size) DWORDs;
+        # one RelationProcessorCore record per physical core, across all groups
+        cores = 0
+        offset = 0
+        while offset < length.value:
+            relationship, size = (wintypes.DWORD * 2).from_buffer(buffer, offset)
+            if relationship == RelationProcessorCore:
+                cores += 1
+            if not size:
+                break
+            offset += size
+        return cores
+    except (AttributeError, OSError, ValueError):
+        return 0
+
+
+def get_compute_type(compute_type: Optional[str], device: str) -> str:
+    """Get the CTranslate2 compute type, picking one for the device if unset.
+
+    int8_float16 uses the GPU's INT8 matmul paths with fp16 activations; CPUs
+    run fastest with plain int8.
+    """
+    if compute_type:
+        return compute_type
+    return "int8_float16" if device == "cuda" else "int8"
+
+
+ICON_SIZE = (64, 64)
+
+
+def load_icon(path: Path, fallback_color: str, shape: str) -> "Image.Image":
+    """Load a 64x64 RGBA tray icon, falling back to a generated shape.
+
+    The decoded and resized pixels are cached in the config folder, keyed by
+    the source file's contents (the bundled EXE extracts icons to a fresh temp
+    folder each launch, so mtimes are useless). Warm starts skip the image
+    decode and LANCZOS resample.
+    """
+    from PIL import Image
+
+    if not path.exists():
+        return create_icon(fallback_color, shape=shape)
+    try:
+        data = path.read_bytes()
+        digest = hashlib.sha1(data).hexdigest()[:16]
+        cache = get_config_dir() / "icon_cache" / f"{path.stem}-{digest}.rgba"
+        if cache.exists():
+            pixels = cache.read_bytes()
+            if len(pixels) == ICON_SIZE[0] * ICON_SIZE[1] * 4:
+                return Image.frombytes("RGBA", ICON_SIZE, pixels)
+
+        image = Image.open(io.BytesIO(data)).convert("RGBA")
+        if image.size != ICON_SIZE:
+            image = image.resize(ICON_SIZE, Image.Resampling.LANCZOS)
+        with contextlib.suppress(OSError):
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            cache.write_bytes(image.tobytes())
+        return image
+    except Exception:
+        return create_icon(fallback_color, shape=shape)
+
+
+# Pre-encoded 64x64 PNG of create_icon("#388e3c"), the default green circle,
+# so ensure_icon_file() doesn't have to draw and encode it at startup
+_FALLBACK_ICON_PNG_BYTES = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAAuklEQVR42u3byRGDQAwAQcLy"
+    "gxidskkB8B46WlUOYPqFQToOY4xZNJ/v+bv7axdcCmRkeCqImeGhIVaGh4PYGb8VIUL4NoiI"
+    "8csQIsdPR8gQPw0hU/wUhNYAGeOHIWSOH4LQGqBC/F8IrQEqxb9CaA1QMf4RAgAAjQEqx99C"
+    "AAAAAAAAAAAAAOBx2J8hAAC8FvNStC+ADyMAfBsEYD/AhggAW2L2BG2K2hW2Le5ewMWImyFX"
+    "Y+4GjSk5F9Y4DS54NtovAAAAAElFTkSuQmCC"
+)
+
+
 def ensure_icon_file() -> Optional[Path]:
     try:
         if ICON_FILE.exists():
             return ICON_FILE
-        image = create_icon("#388e3c")
         ICON_FILE.parent.mkdir(parents=True, exist_ok=True)
-        image.save(ICON_FILE, format="PNG")
+        ICON_FILE.write_bytes(_FALLBACK_ICON_PNG_BYTES)
         return ICON_FILE
     except Exception as exc:  # pragma: no cover
         logger.warning("Unable to create icon file: %s", exc)
@@ -111,23 +340,34 @@ def ensure_icon_file() -> Optional[Path]:
 
 
 class Recorder:
+    # Initial buffer capacity; doubles if a recording runs longer
+    INITIAL_SECONDS = 60
+
     def __init__(self, samplerate: int, device: Optional[int]):
         self.samplerate = samplerate
         self.device = device
         self._stream = None
-        self._frames = []
-        self._lock = threading.Lock()
+        # Audio is written straight into one preallocated buffer. The stream
+        # callback is the only writer, and stop() only reads after the stream
+        # is closed, so no lock is needed.
+        self._buf = np.empty(self.INITIAL_SECONDS * samplerate, dtype=np.float32)
+        self._write = 0
 
     def _callback(self, indata, frames, time_info, status):
         if status:
             print(f"Audio callback warning: {status}", file=sys.stderr)
-        with self._lock:
-            self._frames.append(indata.copy())
+        end = self._write + frames
+        if end > len(self._buf):
+            grown = np.empty(max(2 * len(self._buf), end), dtype=np.float32)
+            grown[:self._write] = self._buf[:self._write]
+            self._buf = grown
+        self._buf[self._write:end] = indata[:, 0]
+        self._write = end
 
     def start(self):
         if self._stream is not None:
             return
-        self._frames = []
+        self._write = 0
         self._stream = sd.InputStream(
             samplerate=self.samplerate,
             channels=1,
@@ -143,24 +383,32 @@ class Recorder:
         self._stream.stop()
         self._stream.close()
         self._stream = None
-        with self._lock:
-            if not self._frames:
-                return None
-            audio = np.concatenate(self._frames, axis=0).flatten()
-        return audio
+        if not self._write:
+            return None
+        return self._buf[:self._write].copy()
 
 
 class TrayApp:
-    def __init__(self, args, config=None):
+    def __init__(self, args, config=None, open_settings_on_start: bool = False):
         self.args = args
         self.config = config or {}
+        self.open_settings_on_start = open_settings_on_start
 
         # Set custom model path if configured
         custom_model_path = get_model_download_path()
         if custom_model_path:
             os.environ["HF_HOME"] = str(custom_model_path)
 
-        self.model = WhisperModel(args.model_size, device=args.device, compute_type=args.compute_type)
+        compute_type = get_compute_type(args.compute_type, args.device)
+        self.cpu_threads = self.config.get("cpu_threads", 0)
+        self.model = self._load_model(args.model_size, compute_type, self.cpu_threads)
+        # Recently used models, so switching back and forth in Settings is instant.
+        # The lock guards self.model and the cache across the loader thread.
+        self._model_lock = threading.RLock()
+        self._model_cache = OrderedDict({(args.model_size, compute_type, self.cpu_threads): self.model})
+        # (model_size, compute_type, cpu_threads) a background load is working
+        # towards, so saving Settings again mid-load doesn't start a second one
+        self._pending_model_key = None
         self.recorder = Recorder(args.samplerate, args.input_device)
         self.recording = False
         self.processing = False
@@ -177,6 +425,7 @@ class TrayApp:
             self.icon_path = Path(__file__).parent.parent / "icons" / "mic_icon.png"
         if not self.icon_path.exists():
             self.icon_path = args.icon_path or ensure_icon_file()
+        self._resolved_icon_path = str(Path(self.icon_path).resolve()) if self.icon_path else None
 
         # New settings
         self.save_transcription_log = self.config.get("save_transcription_log", True)
@@ -187,8 +436,10 @@ class TrayApp:
         self.history_length = self.config.get("history_length", 20)
 
         # Initialize transcription window manager (disabled for now)
+        from transcription_window import get_transcription_window_manager
         self.transcription_manager = get_transcription_window_manager()
         self.transcription_manager.set_enabled(False)  # Disabled - future release
+        self.transcription_manager.set_history_length(self.history_length)
         # self.transcription_manager.set_always_on_top(
         #     self.config.get("transcription_window_always_on_top", True)
         # )
@@ -212,7 +463,7 @@ class TrayApp:
         except Exception:
             pass
 
-        # Load idle icon from file, fallback to generated if not found
+        # Load tray icons from file, fallback to generated if not found
         # For PyInstaller bundled app, use sys._MEIPASS; otherwise use relative path
         if getattr(sys, 'frozen', False):
             # Running as bundled EXE
@@ -220,79 +471,151 @@ class TrayApp:
         else:
             # Running as script
             icons_dir = Path(__file__).parent.parent / "icons"
-        idle_icon_path = icons_dir / "idle_icon.webp"
-        if idle_icon_path.exists():
-            try:
-                self.icon_idle = Image.open(idle_icon_path).convert("RGBA")
-                # Resize to appropriate icon size if needed
-                if self.icon_idle.size != (64, 64):
-                    self.icon_idle = self.icon_idle.resize((64, 64), Image.Resampling.LANCZOS)
-            except:
-                self.icon_idle = create_icon("#00ff00", shape="circle")
-        else:
-            self.icon_idle = create_icon("#00ff00", shape="circle")
-
-        # Load recording icon from file, fallback to generated if not found
-        recording_icon_path = icons_dir / "recording_icon.png"
-        if recording_icon_path.exists():
-            try:
-                self.icon_recording = Image.open(recording_icon_path).convert("RGBA")
-                # Resize to appropriate icon size if needed
-                if self.icon_recording.size != (64, 64):
-                    self.icon_recording = self.icon_recording.resize((64, 64), Image.Resampling.LANCZOS)
-            except:
-                self.icon_recording = create_icon("#ff0000", shape="square")
-        else:
-            self.icon_recording = create_icon("#ff0000", shape="square")
-
-        # Load processing icon from file, fallback to generated if not found
-        processing_icon_path = icons_dir / "processing_icon.webp"
-        if processing_icon_path.exists():
-            try:
-                self.icon_processing = Image.open(processing_icon_path).convert("RGBA")
-                # Resize to appropriate icon size if needed
-                if self.icon_processing.size != (64, 64):
-                    self.icon_processing = self.icon_processing.resize((64, 64), Image.Resampling.LANCZOS)
-            except:
-                self.icon_processing = create_icon("#ffff00", shape="triangle")
-        else:
-            self.icon_processing = create_icon("#ffff00", shape="triangle")
+        self.icon_idle = load_icon(icons_dir / "idle_icon.webp", "#00ff00", "circle")
+        self.icon_recording = load_icon(icons_dir / "recording_icon.png", "#ff0000", "square")
+        self.icon_processing = load_icon(icons_dir / "processing_icon.webp", "#ffff00", "triangle")
 
+        # Built once; dynamic parts (recording label, history) are callables
+        import pystray
+        self._menu = self._build_menu()
         self.icon = pystray.Icon(
             "Whisper Dictation",
             icon=self.icon_idle,
             title="Whisper Dictation",
-            menu=self._build_menu(),
+            menu=self._menu,
         )
 
         keyboard.add_hotkey(self.args.hotkey, self.toggle_recording)
         keyboard.add_hotkey('esc', self.cancel_recording)
         self.icon.visible = False
 
+        # Run one throwaway transcription in the background so the one-time
+        # model setup doesn't land on the user's first dictation
+        self._warmup_done = threading.Event()
+        threading.Thread(target=self._warmup, daemon=True).start()
+
+    def _warmup(self):
+        """Transcribe a second of silence to initialize the model."""
+        self._warm_model(self.model)
+        self._warmup_done.set()
+
+    def _warm_model(self, model: "WhisperModel"):
+        """Run a throwaway transcription so one-time setup happens now."""
+        with contextlib.suppress(Exception):
+            silence = np.zeros(self.args.samplerate, dtype=np.float32)
+            segments, _ = model.transcribe(silence, language=self.args.language, beam_size=1)
+            list(segments)  # transcribe() is lazy - decoding runs on iteration
+            logger.info("Model warm-up complete")
+
+    def _load_model(self, model_size: str, compute_type: str, cpu_threads: int) -> "WhisperModel":
+        """Construct a WhisperModel, sizing the CPU thread pool to physical cores."""
+        from faster_whisper import WhisperModel  # Lazy: loads CTranslate2
+
+        kwargs = {"device": self.args.device, "compute_type": compute_type}
+        if self.args.device == "cpu":
+            kwargs["cpu_threads"] = cpu_threads or get_physical_cores()
+            kwargs["num_workers"] = self.config.get("num_workers", 1)
+        return WhisperModel(model_size, **kwargs)
+
+    def _swap_model(self, model_size: str, compute_type: Optional[str], cpu_threads: int):
+        """Load a model in the background and switch to it once it's ready.
+
+        Transcriptions keep using the current model until the switch. Does
+        nothing if that model is already in use or being loaded.
+        """
+        target = (model_size, compute_type, cpu_threads)
+        with self._model_lock:
+            current = (self.args.model_size, self.args.compute_type, self.cpu_threads)
+            if target == self._pending_model_key or (
+                self._pending_model_key is None and target == current
+            ):
+                return
+            self._pending_model_key = target
+
+        def load():
+            device_compute_type = get_compute_type(compute_type, self.args.device)
+            key = (model_size, device_compute_type, cpu_threads)
+            try:
+                with self._model_lock:
+                    model = self._model_cache.get(key)
+                if model is None:
+                    self.notify(f"Loading {model_size} model...")
+                    model = self._load_model(model_size, device_compute_type, cpu_threads)
+                    self._warm_model(model)
+
+                with self._model_lock:
+                    self._model_cache[key] = model
+                    self._model_cache.move_to_end(key)
+                    # Keep at most two models loaded; dropping the last
+                    # reference frees the evicted model's memory
+                    while len(self._model_cache) > MODEL_CACHE_SIZE:
+                        self._model_cache.popitem(last=False)
+                    if self._pending_model_key != target:
+                        return  # Settings picked another model while this one loaded
+                    self._pending_model_key = None
+                    self.model = model
+                    self.args.model_size = model_size
+                    self.args.compute_type = compute_type
+                    self.cpu_threads = cpu_threads
+                self.notify(f"Model switched to {model_size}")
+            except Exception as exc:
+                with self._model_lock:
+                    if self._pending_model_key == target:
+                        self._pending_model_key = None
+                handle_error(exc, "model switch", self.notify)
+
+        threading.Thread(target=load, daemon=True).start()
+
     def _create_status_window(self):
-        """Create a small always-on-top status window."""
-        self.status_window = tk.Tk()
-        self.status_window.title("Whisper Status")
-        self.status_window.attributes('-topmost', True)
-        self.status_window.attributes('-alpha', 0.9)
-        self.status_window.geometry("200x60+10+10")  # Top-left corner
-        self.status_window.resizable(False, False)
-
-        self.status_label = tk.Label(
-            self.status_window,
-            text="IDLE",
-            font=("Arial", 16, "bold"),
-            bg="#388e3c",
-            fg="white",
-            padx=10,
-            pady=10
-        )
-        self.status_label.pack(fill=tk.BOTH, expand=True)
+        """Create a small always-on-top status window.
+
+        The window lives on its own thread running the Tk main loop; other
+        threads hand it updates through _status_queue (see notify).
+        """
+        self._status_queue = queue.Queue()
+        ready = threading.Event()
 
-        # Don't let it take focus
-        self.status_window.attributes('-toolwindow', True)
+        def run():
+            import tkinter as tk
+            self.status_window = tk.Tk()
+            self.status_window.title("Whisper Status")
+            self.status_window.attributes('-topmost', True)
+            self.status_window.attributes('-alpha', 0.9)
+            self.status_window.geometry("200x60+10+10")  # Top-left corner
+            self.status_window.resizable(False, False)
+
+            self.status_label = tk.Label(
+                self.status_window,
+                text="IDLE",
+                font=("Arial", 16, "bold"),
+                bg="#388e3c",
+                fg="white",
+                padx=10,
+                pady=10
+            )
+            self.status_label.pack(fill=tk.BOTH, expand=True)
+
+            # Don't let it take focus
+            self.status_window.attributes('-toolwindow', True)
+
+            ready.set()
+            self.status_window.mainloop()
+
+        threading.Thread(target=run, daemon=True).start()
+        ready.wait(timeout=5)
+
+    def _drain_status_queue(self):
+        """Apply the latest queued status. Runs on the status window's thread."""
+        latest = None
+        with contextlib.suppress(queue.Empty):
+            while True:
+                latest = self._status_queue.get_nowait()
+        if latest:
+            text, bg_color = latest
+            self.status_label.config(text=text, bg=bg_color)
 
     def _build_menu(self):
+        import pystray
         return pystray.Menu(
             pystray.MenuItem(self._menu_label, self._menu_toggle),
             pystray.Menu.SEPARATOR,
@@ -322,14 +645,15 @@ class TrayApp:
 
     def _build_history_menu(self):
         """Build the history submenu dynamically."""
-        logger.debug(f"Building history menu, {len(self.history)} items in history")
+        import pystray
+        logger.debug("Building history menu, %d items in history", len(self.history))
         if not self.history:
             return (pystray.MenuItem("(empty)", None, enabled=False),)
 
         items = []
         for i, text in enumerate(self.history[:self.history_length]):
             display = f"{text[:50]}..." if len(text) > 50 else text
-            logger.debug(f"  History item {i}: {display}")
+            logger.debug("  History item %d: %s", i, display)
             # Use default=True for first item so it's highlighted
             items.append(pystray.MenuItem(
                 display,
@@ -346,7 +670,7 @@ class TrayApp:
             # Windows explorer
             subprocess.run(["explorer", str(log_dir)], check=False)
         except Exception as e:
-            logger.error(f"Failed to open log folder: {e}")
+            logger.error("Failed to open log folder: %s", e)
             self.notify("Could not open log folder")
 
     def _toggle_transcription_window(self, icon=None, item=None):
@@ -392,42 +716,16 @@ class TrayApp:
                         self.args.hotkey = new_hotkey
                         self.notify(f"Hotkey changed to {new_hotkey}")
                     except Exception as e:
-                        logger.error(f"Failed to update hotkey: {e}")
+                        logger.error("Failed to update hotkey: %s", e)
                         self.notify("Failed to change hotkey")
 
-                # Check if model changed (requires restart)
-                if new_config.get("model_size") != self.args.model_size:
-                    from tkinter import messagebox
-                    import subprocess
-                    import time
-
-                    # Force config save again to ensure it's on disk
-                    from config import save_config, load_config
-                    current = load_config()
-                    current["model_size"] = new_config.get("model_size")
-                    save_config(current)
-
-                    restart = messagebox.askyesno(
-                        "Restart Required",
-                        f"Model changed to '{new_config.get('model_size')}'.\n\n"
-                        "WhisperTray needs to restart for this change to take effect.\n\n"
-                        "Restart now?"
-                    )
-                    if restart:
-                        # Restart the application
-                        import sys
-                        import os
-
-                        # Small delay to ensure config is flushed to disk
-                        time.sleep(0.5)
-
-                        if getattr(sys, 'frozen', False):
-                            # Running as EXE - launch self and exit
-                            subprocess.Popen([sys.executable])
-                        else:
-                            # Running as script
-                            subprocess.Popen([sys.executable] + sys.argv)
-                        os._exit(0)  # Exit immediately
+                # Load the new model in the background if the model settings
+                # changed (_swap_model skips the current or already-loading one)
+                self._swap_model(
+                    new_config.get("model_size", self.args.model_size),
+                    new_config.get("compute_type"),
+                    new_config.get("cpu_threads", 0),
+                )
 
                 # Update config object
                 self.config.update(new_config)
@@ -439,7 +737,7 @@ class TrayApp:
 
     def _copy_to_clipboard(self, text: str):
         """Copy text from history to clipboard."""
-        pyperclip.copy(text)
+        clipboard.copy(text)
         self.notify(f"Copied: {text[:30]}...")
 
     def cancel_recording(self):
@@ -454,7 +752,7 @@ class TrayApp:
         self.transcription_manager.on_recording_cancelled()
 
     def notify(self, message: str):
-        logger.info(f"Notification: {message}")
+        logger.info("Notification: %s", message)
 
         # Update tray icon tooltip with the message
         self.icon.title = f"Whisper: {message}"
@@ -483,8 +781,12 @@ class TrayApp:
                 bg_color = "#388e3c"
                 text = "IDLE"
 
-            self.status_label.config(text=text, bg=bg_color)
-            self.status_window.update()
+            # Hand the update to the window's Tk thread. Updates that pile up
+            # before it runs are coalesced - only the latest is drawn.
+            import tkinter as tk  # Already loaded by _create_status_window
+            self._status_queue.put((text, bg_color))
+            with contextlib.suppress(tk.TclError, RuntimeError):
+                self.status_window.after(0, self._drain_status_queue)
 
         # Only show toast notifications if enabled
         if not self.show_toast_notifications:
@@ -497,20 +799,21 @@ class TrayApp:
                     app_id="WhisperDictation",
                     title="Whisper Dictation",
                     msg=message,
-                    icon=str(Path(self.icon_path).resolve()) if self.icon_path else None,
+                    icon=self._resolved_icon_path,
                     duration="short",
                 )
                 toast.show()
                 logger.info("Toast notification sent via winotify")
+                return
             except Exception as exc:
-                logger.error(f"winotify toast failed: {exc}", exc_info=True)
+                logger.error("winotify toast failed: %s", exc, exc_info=True)
 
         # Fallback to pystray notification
         try:
             self.icon.notify(message, "Whisper Dictation")
             logger.info("Notification sent via pystray")
         except Exception as exc:
-            logger.error(f"pystray notification failed: {exc}", exc_info=True)
+            logger.error("pystray notification failed: %s", exc, exc_info=True)
 
     def toggle_recording(self):
         if self.processing:
@@ -547,10 +850,12 @@ class TrayApp:
 
     def _transcribe_async(self, audio: np.ndarray):
         try:
+            if not self._warmup_done.is_set():
+                logger.info("Transcribing before model warm-up finished")
+
             # Log audio stats for debugging
-            audio_max = np.max(np.abs(audio))
-            audio_mean = np.mean(np.abs(audio))
-            logger.info(f"Audio stats: max={audio_max:.6f}, mean={audio_mean:.6f}, samples={len(audio)}")
+            audio_max, audio_mean = audio_stats(audio)
+            logger.info("Audio stats: max=%.6f, mean=%.6f, samples=%d", audio_max, audio_mean, len(audio))
 
             # Check audio quality and warn user
             quality_msg = get_audio_quality_message(audio_max, audio_mean)
@@ -559,10 +864,26 @@ class TrayApp:
                 self.notify(quality_msg)
                 # Continue anyway - might still get some transcription
 
-            segments, _ = self.model.transcribe(
+            # Don't run the model on an accidental double-tap or a dead-silent clip
+            min_samples = int(self.config.get("min_audio_seconds", 0.4) * self.args.samplerate)
+            if len(audio) < min_samples or audio_max < self.config.get("min_audio_level", 0.005):
+                logger.info("Audio too short or silent; skipping transcription")
+                if not is_silent_audio(audio_max, audio_mean):  # Silence warning already shown
+                    short_msg, _ = get_friendly_error("transcription_empty")
+                    self.notify(short_msg)
+                self.transcription_manager.on_error("No speech detected")
+                return
+
+            with self._model_lock:
+                model = self.model
+            segments, _ = model.transcribe(
                 audio,
                 language=self.args.language,
                 beam_size=self.args.beam_size,
+                without_timestamps=self.config.get("without_timestamps", True),
+                condition_on_previous_text=self.config.get("condition_on_previous_text", False),
+                vad_filter=self.config.get("vad_filter", True),
+                vad_parameters={"min_silence_duration_ms": self.config.get("vad_min_silence_ms", 300)},
             )
             text = "".join(segment.text for segment in segments).strip()
             if self.trailing_space and text and not text.endswith(" "):
@@ -579,13 +900,13 @@ class TrayApp:
 
                 # Auto-copy to clipboard (always, as backup)
                 if self.auto_copy_to_clipboard:
-                    pyperclip.copy(text)
+                    clipboard.copy(text)
 
                 # Update transcription window
                 self.transcription_manager.on_transcription_complete(text.strip())
 
-                # Force menu rebuild to update history
-                self.icon.menu = self._build_menu()
+                # Re-evaluate the dynamic menu parts so History shows the new item
+                self.icon.update_menu()
 
                 # Send text to active window
                 self._send_text(text)
@@ -604,43 +925,51 @@ class TrayApp:
 
     def _send_text(self, text: str):
         import pyautogui  # Lazy import to avoid DPI issues during wizard
-        time.sleep(self.args.pre_type_delay)
+        wait_focus_stable(self.args.pre_type_delay)
 
         if self.use_typing:
-            # Type character-by-character using keyboard library (better terminal support)
-            keyboard.write(text, delay=self.args.type_delay)
+            # Type the text as keystrokes (better terminal support). Real key
+            # presses by default; remote sessions and VMs often ignore the
+            # Unicode (VK_PACKET) input of the faster single-batch mode.
+            batch = self.config.get("batch_typing", False) and not self.args.type_delay
+            if not (batch and send_unicode_text(text)):
+                keyboard.write(text, delay=self.args.type_delay)
             if self.send_enter:
                 keyboard.press_and_release('enter')
         else:
             # Use clipboard paste (faster but doesn't work in terminals)
-            if not self.keep_clipboard:
-                previous_clipboard = pyperclip.paste()
-            else:
-                previous_clipboard = None
+            previous_clipboard = clipboard.snapshot_and_set(
+                text, snapshot=not self.keep_clipboard
+            )
             try:
-                pyperclip.copy(text)
                 pyautogui.hotkey("ctrl", "v")
                 if self.send_enter:
                     pyautogui.press("enter")
             finally:
                 if previous_clipboard is not None:
+                    # Ctrl+V is handled asynchronously by the target window;
+                    # give it a moment to read the clipboard before restoring
                     time.sleep(0.05)
-                    pyperclip.copy(previous_clipboard)
+                    clipboard.restore(previous_clipboard)
 
     def run(self):
         self.icon.icon = self.icon_idle
         self.icon.title = "Idle"
         self.icon.run(self._setup)
 
-    def _setup(self, icon: pystray.Icon):
+    def _setup(self, icon: "pystray.Icon"):
         logger.info("Tray icon setup complete; showing notification.")
         with contextlib.suppress(Exception):
             icon.visible = True
             self.notify(f"Whisper Dictation ready (hotkey {self.args.hotkey})")
+        if self.open_settings_on_start:
+            # Tray is registered now; Settings runs on its own thread
+            logger.info("Opening settings after first run.")
+            self._open_settings()
         if self.start_popup:
             msg = f"Whisper Dictation is running.\nHotkey: {self.args.hotkey}\nUse the tray icon to start/stop or quit."
             with contextlib.suppress(Exception):
-                ctypes.windll.user32.MessageBoxW(0, msg, "Whisper Dictation", 0x00000040)
+                _MessageBoxW(0, msg, "Whisper Dictation", MB_ICONINFORMATION)
 
     def stop(self, icon=None, item=None):
         """Stop the application and exit."""
@@ -674,7 +1003,7 @@ def parse_args():
     parser = argparse.ArgumentParser(description="Tray dictation button that types Whisper transcriptions into the active window.")
     parser.add_argument("--model-size", default="small", help="Whisper model to load (tiny, base, small, medium, large-v2, etc).")
     parser.add_argument("--device", default="cpu", help="Inference device to use (cpu, cuda).")
-    parser.add_argument("--compute-type", default="int8", help="Quantization to use with faster-whisper.")
+    parser.add_argument("--compute-type", default=None, help="Quantization to use with faster-whisper (default: int8 on CPU, int8_float16 on CUDA).")
     parser.add_argument("--samplerate", type=int, default=16000, help="Recording samplerate.")
     parser.add_argument("--language", default="en", help="Language hint for Whisper.")
     parser.add_argument("--beam-size", type=int, default=1, help="Beam size for decoding.")
@@ -684,7 +1013,7 @@ def parse_args():
     parser.add_argument("--use-typing", action="store_true", help="Type text character-by-character instead of using clipboard paste (works in terminals).")
     parser.add_argument("--keep-clipboard", action="store_true", help="Leave the clipboard untouched (transcription temporarily replaces it otherwise).")
     parser.add_argument("--show-status-window", action="store_true", help="Show an always-on-top status window for visual feedback.")
-    parser.add_argument("--pre-type-delay", type=float, default=0.2, help="Delay (seconds) before typing to allow window focus.")
+    parser.add_argument("--pre-type-delay", type=float, default=0.2, help="Maximum time (seconds) to wait for window focus to settle before typing.")
     parser.add_argument("--type-delay", type=float, default=0.0, help="Delay between keystrokes sent by pyautogui.")
     parser.add_argument("--no-start-popup", action="store_true", help="Suppress the startup confirmation popup window.")
     parser.add_argument("--list-devices", action="store_true", help="List available audio input devices and exit.")
@@ -694,24 +1023,34 @@ def parse_args():
     return args
 
 
-def check_models_available():
-    """Check if any models are downloaded, offer to download if not."""
-    downloaded = get_downloaded_models()
+def check_models_available(config: Optional[dict] = None):
+    """Check if any models are downloaded, offer to download if not.
+
+    Args:
+        config: Already-loaded configuration, to avoid reading it again
+    """
+    if config is not None:
+        downloaded = config.get("downloaded_models", [])
+    else:
+        downloaded = get_downloaded_models()
     if downloaded:
         return True  # At least one model available
 
-    # No models downloaded - show dialog
-    import ctypes
-    result = ctypes.windll.user32.MessageBoxW(
+    # No models downloaded - show dialog with the recommended download
+    recommended = [
+        f"{name} ({info['size']})" for name, info in MODEL_INFO.items() if info.get("recommended")
+    ]
+    result = _MessageBoxW(
         0,
         "No transcription models are downloaded.\n\n"
+        f"Recommended: {', '.join(recommended)}\n\n"
         "Would you like to open Settings to download a model?\n\n"
         "Click 'Yes' to open Settings, or 'No' to exit.",
         "Whisper Tray - No Models",
-        0x00000024  # MB_YESNO | MB_ICONQUESTION
+        MB_YESNO_QUESTION,
     )
 
-    if result == 6:  # IDYES
+    if result == IDYES:
         # Open settings to Storage tab
         try:
             import tkinter as tk
@@ -724,53 +1063,82 @@ def check_models_available():
             # Check again after settings closed
             return bool(get_downloaded_models())
         except Exception as e:
-            logger.error(f"Failed to open settings: {e}")
+            logger.error("Failed to open settings: %s", e)
             return False
     else:
         return False  # User chose not to download
 
 
-# Module-level mutex handle - must stay alive for single-instance check to work
-_instance_mutex = None
+# TrayApp arguments that fall back to these when missing from the merged config
+_ARG_DEFAULTS = {
+    "model_size": "small",
+    "device": "cpu",
+    "compute_type": None,  # None = pick for device
+    "samplerate": 16000,
+    "language": "en",
+    "beam_size": 1,
+    "hotkey": "ctrl+alt+space",
+    "send_enter": True,
+    "use_typing": False,
+    "keep_clipboard": False,
+    "show_status_window": False,
+    "pre_type_delay": 0.2,
+    "type_delay": 0.0,
+    "input_device": None,
+}
+
+
+# Module-level lock file descriptor - must stay open (and locked) for the
+# single-instance check to work
+_instance_lock = None
 
 def check_single_instance():
     """Ensure only one instance of WhisperTray is running."""
-    global _instance_mutex
-    import ctypes
-    # Create a named mutex - if it already exists, another instance is running
-    mutex_name = "WhisperTray_SingleInstance_Mutex"
-    _instance_mutex = ctypes.windll.kernel32.CreateMutexW(None, False, mutex_name)
-    last_error = ctypes.windll.kernel32.GetLastError()
-
-    # ERROR_ALREADY_EXISTS = 183
-    if last_error == 183:
-        ctypes.windll.user32.MessageBoxW(
+    global _instance_lock
+    import msvcrt
+    import tempfile
+    # Lock the first byte of a lock file - if another instance holds the lock,
+    # it's running. Windows drops the lock when the owning process exits.
+    lock_path = os.path.join(tempfile.gettempdir(), "whispertray.lock")
+    try:
+        fd = os.open(lock_path, os.O_CREAT | os.O_RDWR)
+    except OSError:
+        return True  # Can't create the lock file; don't block startup over it
+
+    try:
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        os.close(fd)
+        _MessageBoxW(
             0,
             "WhisperTray is already running.\n\nCheck your system tray (click ^ to see hidden icons).",
             "WhisperTray",
-            0x00000040  # MB_ICONINFORMATION
+            MB_ICONINFORMATION,
         )
         return False
+    _instance_lock = fd
     return True
 
 
 def main():
-    configure_logging()
-    set_app_id()
-
-    # Prevent multiple instances
-    if not check_single_instance():
-        return
-
-    logger.info("Starting Whisper tray helper.")
-
-    # Handle list-devices before loading config
+    # Handle list-devices before anything else - it only prints, so it needs
+    # no logging or config and may run alongside the tray
     args = parse_args()
     if args.list_devices:
         for line in list_input_devices():
             print(line)
         return
 
+    # Prevent multiple instances. Checked before logging is set up so a
+    # duplicate launch exits without opening the log file.
+    if not check_single_instance():
+        return
+
+    configure_logging()
+    set_app_id()
+
+    logger.info("Starting Whisper tray helper.")
+
     # Load configuration
     config = load_config()
     logger.info("Configuration loaded: %s", config)
@@ -790,11 +1158,11 @@ def main():
             show_settings_after_start = True  # Open settings after first run
             logger.info("First-run wizard completed.")
         except Exception as e:
-            logger.error(f"First-run wizard failed: {e}")
+            logger.error("First-run wizard failed: %s", e)
             # Continue with defaults
 
     # Check if any models are downloaded
-    if not check_models_available():
+    if not check_models_available(config):
         logger.info("No models available, exiting.")
         return
 
@@ -803,67 +1171,55 @@ def main():
     logger.info("Merged configuration: %s", merged_config)
 
     # Create args namespace from merged config for TrayApp
-    class MergedArgs:
-        pass
-
-    merged_args = MergedArgs()
-    merged_args.model_size = merged_config.get("model_size", "small")
-    merged_args.device = merged_config.get("device", "cpu")
-    merged_args.compute_type = merged_config.get("compute_type", "int8")
-    merged_args.samplerate = merged_config.get("samplerate", 16000)
-    merged_args.language = merged_config.get("language", "en")
-    merged_args.beam_size = merged_config.get("beam_size", 1)
-    merged_args.hotkey = merged_config.get("hotkey", "ctrl+alt+space")
-    merged_args.send_enter = merged_config.get("send_enter", True)
+    merged_args = types.SimpleNamespace(**{**_ARG_DEFAULTS, **merged_config})
     merged_args.no_trailing_space = not merged_config.get("trailing_space", True)
-    merged_args.use_typing = merged_config.get("use_typing", False)
-    merged_args.keep_clipboard = merged_config.get("keep_clipboard", False)
-    merged_args.show_status_window = merged_config.get("show_status_window", False)
-    merged_args.pre_type_delay = merged_config.get("pre_type_delay", 0.2)
-    merged_args.type_delay = merged_config.get("type_delay", 0.0)
     merged_args.no_start_popup = args.no_start_popup  # Keep CLI value for this
-    merged_args.input_device = merged_config.get("input_device")
     merged_args.icon_path = args.icon_path  # Keep CLI value
 
-    logger.info("Arguments parsed: %s", merged_args.__dict__)
+    if logger.isEnabledFor(logging.INFO):
+        # Only the TrayApp arguments - the full config was logged above
+        arg_keys = (*_ARG_DEFAULTS, "no_trailing_space", "no_start_popup", "icon_path")
+        logger.info("Arguments parsed: %s", {key: getattr(merged_args, key) for key in arg_keys})
 
+    # Startup failures (model load, audio device, hotkey) come from several
+    # libraries with their own exception types, so classify_error() sorts
+    # them into a friendly dialog
     try:
-        app = TrayApp(merged_args, merged_config)
-        logger.info("TrayApp instantiated, entering run loop.")
-
         # Open settings after first run so user can review all options
-        if show_settings_after_start:
-            logger.info("Opening settings after first run.")
-            # Schedule settings to open shortly after tray starts
-            import threading
-            def open_settings_delayed():
-                import time
-                time.sleep(1)  # Brief delay to let tray initialize
-                app._open_settings()
-            threading.Thread(target=open_settings_delayed, daemon=True).start()
-
-        app.run()
-        logger.info("TrayApp exited run loop.")
+        app = TrayApp(merged_args, merged_config, open_settings_on_start=show_settings_after_start)
     except Exception as e:
         error_type = classify_error(e)
         short_msg, detailed_msg = get_friendly_error(error_type)
-        logger.error(f"Failed to start: {e}", exc_info=True)
+        logger.error("Failed to start: %s", e, exc_info=True)
         # Show error dialog
         try:
-            import ctypes
-            ctypes.windll.user32.MessageBoxW(
+            _MessageBoxW(
                 0,
                 f"{short_msg}\n\n{detailed_msg}\n\nTechnical: {e}",
                 "Whisper Dictation Error",
-                0x00000010  # MB_ICONERROR
+                MB_ICONERROR,
             )
         except Exception:
             print(f"Error: {short_msg}\n{detailed_msg}")
+        return
+
+    logger.info("TrayApp instantiated, entering run loop.")
+    try:
+        app.run()
+    except KeyboardInterrupt:
+        pass  # Ctrl+C when run from a console
+    except Exception:
+        logger.exception("Tray run loop crashed")
+        raise
+    logger.info("TrayApp exited run loop.")
 
 
 if __name__ == "__main__":
     # Required for PyInstaller when using multiprocessing or libraries that spawn processes
-    # This prevents duplicate processes from running the full main() again
-    import multiprocessing
-    multiprocessing.freeze_support()
+    # This prevents duplicate processes from running the full main() again.
+    # freeze_support() only does anything in a frozen EXE, so skip importing
+    # multiprocessing when running from source.
+    if getattr(sys, 'frozen', False):
+        import multiprocessing
+        multiprocessing.freeze_support()
     main()
@@ -37,12 +37,16 @@ datas += [
     ('scripts/errors.py', 'scripts'),
     ('scripts/transcription_window.py', 'scripts'),
     ('scripts/installer.py', 'scripts'),
+    ('scripts/clipboard.py', 'scripts'),
 ]
 
 # Hidden imports for faster-whisper and dependencies
 hiddenimports = [
     'faster_whisper',
     'ctranslate2',
+    'onnxruntime',  # Silero VAD (vad_filter), imported lazily by faster_whisper
+    'huggingface_hub',
+    'hf_transfer',
     'sounddevice',
     'numpy',
     'PIL',
@@ -51,7 +55,6 @@ hiddenimports = [
     'pystray',
     'pystray._win32',
     'keyboard',
-    'pyperclip',
     'pyautogui',
     'winotify',
     'tkinter',